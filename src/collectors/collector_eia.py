@@ -8,35 +8,38 @@ Requirements:
     - utils.py for helper functions
 """
 
-import os
-import requests
 import pandas as pd
-from dotenv import load_dotenv
-from utils import setup_logging, api_error_handler, save_to_csv
+from concurrent.futures import ThreadPoolExecutor
+from utils import API_KEYS, setup_logging, api_error_handler, get_session, load_json, save_to_csv
 
 class EIADataCollector:
     def __init__(self): 
         self.logger = setup_logging(__name__) 
-        load_dotenv() 
-        self.api_key = os.getenv('EIA_API_KEY')
+        self.api_key = API_KEYS['eia']
         if not self.api_key:
             raise ValueError("EIA API key not found") 
         
         self.base_url = "https://api.eia.gov/v2" 
+        self.session = get_session()
 
     @api_error_handler 
     def fetch_data(self, endpoint, params): 
         params['api_key'] = self.api_key
-        response = requests.get(f"{self.base_url}/{endpoint}", params=params) 
+        response = self.session.get(f"{self.base_url}/{endpoint}", params=params) 
         response.raise_for_status()
-        return response.json()['response']['data']
+        return load_json(response)['response']['data']
 
     def get_data(self, endpoint, params, value_column):
         data = self.fetch_data(endpoint, params)
         if data:
-            df = pd.DataFrame(data)
-            df['date'] = pd.to_datetime(df['period'])
-            return df[['date', 'value']].rename(columns={'value': value_column})
+            # Build the two columns directly instead of going through list-of-records
+            periods = [row['period'] for row in data]
+            values = [row['value'] for row in data]
+            # Daily and weekly periods both come back as YYYY-MM-DD
+            return pd.DataFrame({
+                'date': pd.to_datetime(periods, format='%Y-%m-%d', cache=True),
+                value_column: pd.to_numeric(values, errors='coerce')
+            })
         return None
 
     def collect_all(self):
@@ -49,8 +52,6 @@ class EIADataCollector:
             'sort[0][direction]': 'desc',
             'length': 5000
         }
-        wti_df = self.get_data('petroleum/pri/spt/data', wti_params, 'value')
-        save_to_csv(wti_df, 'wti')
 
         # Crude Stocks
         stocks_params = {
@@ -61,8 +62,22 @@ class EIADataCollector:
             'sort[0][direction]': 'desc',
             'length': 5000
         }
-        stocks_df = self.get_data('petroleum/stoc/wstk/data', stocks_params, 'value')
-        save_to_csv(stocks_df, 'inventory')
+
+        # (endpoint, params, value_column, file prefix)
+        tasks = [
+            ('petroleum/pri/spt/data', wti_params, 'value', 'wti'),
+            ('petroleum/stoc/wstk/data', stocks_params, 'value', 'inventory')
+        ]
+
+        # Endpoints are independent, so fetch them concurrently
+        with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+            futures = [pool.submit(self.get_data, endpoint, params, value_column)
+                       for endpoint, params, value_column, _ in tasks]
+            for (_, _, _, prefix), future in zip(tasks, futures):
+                save_to_csv(future.result(), prefix)
+
+def main():
+    EIADataCollector().collect_all()
 
 if __name__ == "__main__":
-    EIADataCollector().collect_all()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -10,17 +10,14 @@ Requirements:
     - utils.py for helper functions
 """
 
-import os
 import pandas as pd
-import requests
-from dotenv import load_dotenv
-from utils import setup_logging, api_error_handler, save_to_csv
+from concurrent.futures import ThreadPoolExecutor
+from utils import API_KEYS, setup_logging, api_error_handler, get_session, load_json, save_to_csv
 
 class FREDCollector:
     def __init__(self):
         self.logger = setup_logging(__name__)
-        load_dotenv()
-        self.api_key = os.getenv('FRED_API_KEY')
+        self.api_key = API_KEYS['fred']
         if not self.api_key:
             raise ValueError("FRED API key not found")
         
@@ -29,23 +26,34 @@ class FREDCollector:
             'currency': 'DEXUSEU',         
             'gdp': 'GDP'
         }
+        self.session = get_session()
 
     @api_error_handler
     def fetch_data(self, series_id):
-        response = requests.get(
+        response = self.session.get(
             self.base_url,
             params={'series_id': series_id, 'api_key': self.api_key, 'file_type': 'json'}
-        ).json()
+        )
+        observations = load_json(response)['observations']
         
-        df = pd.DataFrame(response['observations'])
-        df['date'] = pd.to_datetime(df['date'])
-        df['value'] = pd.to_numeric(df['value'], errors='coerce')
-        return df[['date', 'value']].dropna()
+        # Build the two columns we keep directly; FRED dates are always ISO YYYY-MM-DD
+        dates = [obs['date'] for obs in observations]
+        values = [obs['value'] for obs in observations]
+        df = pd.DataFrame({
+            'date': pd.to_datetime(dates, format='%Y-%m-%d', cache=True),
+            'value': pd.to_numeric(values, errors='coerce')
+        })
+        return df.dropna()
 
     def collect_all(self):
-        for name, series_id in self.series.items():
-            df = self.fetch_data(series_id)
-            save_to_csv(df, name)
+        # Series are independent, so fetch them concurrently
+        with ThreadPoolExecutor(max_workers=len(self.series)) as pool:
+            results = pool.map(self.fetch_data, self.series.values())
+            for name, df in zip(self.series, results):
+                save_to_csv(df, name)
+
+def main():
+    FREDCollector().collect_all()
 
 if __name__ == "__main__":
-    FREDCollector().collect_all()
\ No newline at end of file
+    main()
\ No newline at end of file
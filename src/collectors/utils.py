@@ -2,12 +2,21 @@
 Utility functions for data collection and processing.
 Provides common functionality used across different collectors:
     - Logging setup
+    - API key loading from .env
     - API error handling
+    - Shared (optionally cached) HTTP session creation
+    - Fast JSON response decoding
+    - Reshaping scraped year x month tables
     - CSV file saving with timestamps
 
 The functions handle common tasks like:
     - Setting up consistent logging across all collectors
+    - Reading the .env file once per process
     - Gracefully handling and logging API errors
+    - Reusing pooled connections and retrying transient server errors
+    - Caching API responses on disk so scheduled re-runs skip unchanged downloads
+    - Decoding API payloads with orjson when installed
+    - Turning wide monthly HTML tables into (date, value) series
     - Saving data with standardized naming and timestamps
 """
 
@@ -16,10 +25,42 @@ from datetime import datetime
 from functools import wraps
 import pandas as pd
 import os
+import threading
+import requests
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-# Logging set up (basic info level)
+try:
+    import orjson
+except ImportError:  # Fall back to requests' stdlib json decoding
+    orjson = None
+
+try:
+    import requests_cache
+except ImportError:  # Response caching is optional
+    requests_cache = None
+
+# API keys, read from .env once at import rather than per collector instance
+load_dotenv()
+API_KEYS = {
+    'eia': os.getenv('EIA_API_KEY'),
+    'fred': os.getenv('FRED_API_KEY')
+}
+
+# On-disk HTTP cache (sqlite), alongside the raw data it produces
+HTTP_CACHE_PATH = 'data/raw/.http_cache'
+
+# Month numbers for the Jan..Dec columns of scraped tables
+MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
+
+# Logging set up (basic info level, configured once per process)
 def setup_logging(name):
-    logging.basicConfig(level=logging.INFO)
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=logging.INFO)
     return logging.getLogger(name)
 
 # Decorator for API error handling (logs errors and returns none)
@@ -29,10 +70,62 @@ def api_error_handler(func):
         try:
             return func(*args, **kwargs)
         except Exception as e:
-            logging.error(f"Error in {func.__name__}: {str(e)}")
+            logging.getLogger(func.__module__).error(f"Error in {func.__name__}: {str(e)}")
             return None
     return wrapper
 
+# HTTP session with keep-alive connection pooling and retries on 5xx responses.
+# Uses a requests-cache session (honouring Cache-Control/ETag) when available; the sqlite
+# cache runs in WAL mode and waits on locks held by other processes instead of failing.
+def create_session(pool_size=8, expire_after=3600):
+    if requests_cache is not None:
+        os.makedirs(os.path.dirname(HTTP_CACHE_PATH), exist_ok=True)
+        session = requests_cache.CachedSession(
+            HTTP_CACHE_PATH, backend='sqlite', expire_after=expire_after, cache_control=True,
+            wal=True, busy_timeout=30000
+        )
+    else:
+        session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+_session = None
+_session_lock = threading.Lock()
+
+# Process-wide session shared by all collectors. The orchestrator runs them concurrently in
+# one process, and one CachedSession serialises every cache write through a single connection.
+def get_session():
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = create_session()
+        return _session
+
+# Decodes a JSON response body, using orjson on the raw bytes when available
+def load_json(response):
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+# Reshapes a wide table (Year, Jan..Dec, ...) into date-sorted (date, value) rows
+def monthly_table_to_series(table):
+    table = table.iloc[:, :13].copy()
+    table.columns = ['year', *MONTHS]
+    df = table.melt(id_vars='year', var_name='month', value_name='value')
+    df['year'] = pd.to_numeric(df['year'], errors='coerce')
+    df['value'] = pd.to_numeric(df['value'], errors='coerce')
+    df = df.dropna(subset=['year', 'value'])
+    # Assemble dates from integer year/month columns, no per-row strings
+    df['date'] = pd.to_datetime(pd.DataFrame({
+        'year': df['year'].astype(int),
+        'month': df['month'].map(MONTHS),
+        'day': 1
+    }))
+    return df[['date', 'value']].sort_values('date').reset_index(drop=True)
+
 # Saves DataFrame to CSV with timestamp and logging
 def save_to_csv(df, prefix):
     if df is not None and not df.empty:
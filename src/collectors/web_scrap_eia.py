@@ -5,14 +5,15 @@ Scrapes data for:
     - U.S. refinery capacity
     - U.S. drilling rig count
 
-Data is collected from EIA's public web pages using BeautifulSoup for HTML parsing.
+Data is collected from EIA's public web pages using pandas.read_html (lxml) for HTML parsing.
 Each dataset is saved as a separate CSV file with timestamps.
 """
 
-import requests
 import pandas as pd
-from bs4 import BeautifulSoup
-from utils import setup_logging, api_error_handler, save_to_csv
+from io import StringIO
+from concurrent.futures import ThreadPoolExecutor
+from utils import (setup_logging, api_error_handler, get_session,
+                   monthly_table_to_series, save_to_csv)
 
 class EIAWebScraper:
     def __init__(self):
@@ -22,36 +23,23 @@ class EIAWebScraper:
             'refinery': 'https://www.eia.gov/dnav/pet/hist/LeafHandler.ashx?n=PET&s=MOPUEUS2&f=M',
             'rigs': 'https://www.eia.gov/dnav/pet/hist/LeafHandler.ashx?n=PET&s=E_ERTRR0_XR0_NUS_C&f=M'
         }
+        self.session = get_session()
 
     @api_error_handler
     def fetch_data(self, url):
-        response = requests.get(url)
-        soup = BeautifulSoup(response.text, 'html.parser')
-        table = soup.find('table', {'class': 'FloatTitle'})
-        
-        data = []
-        for row in table.find_all('tr')[1:]:
-            cols = row.find_all('td')
-            if len(cols) >= 2:
-                year = cols[0].text.strip()
-                for month_num, month_col in enumerate(cols[1:], 1):
-                    value = month_col.text.strip()
-                    if value:
-                        try:
-                            date = f"{year}-{month_num:02d}-01"
-                            value_float = float(value.replace(',', ''))
-                            data.append([date, value_float])
-                        except ValueError:
-                            continue
-        
-        df = pd.DataFrame(data, columns=['date', 'value'])
-        df['date'] = pd.to_datetime(df['date'])
-        return df.sort_values('date')
+        response = self.session.get(url)
+        tables = pd.read_html(StringIO(response.text), attrs={'class': 'FloatTitle'}, thousands=',')
+        return monthly_table_to_series(tables[0])
 
     def collect_all(self):
-        for name, url in self.urls.items():
-            df = self.fetch_data(url)
-            save_to_csv(df, name)
+        # Pages are independent, so fetch them concurrently
+        with ThreadPoolExecutor(max_workers=len(self.urls)) as pool:
+            results = pool.map(self.fetch_data, self.urls.values())
+            for name, df in zip(self.urls, results):
+                save_to_csv(df, name)
+
+def main():
+    EIAWebScraper().collect_all()
 
 if __name__ == '__main__':
-    EIAWebScraper().collect_all()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -6,6 +6,15 @@ from datetime import datetime, timedelta
 import logging
 import json
 import os
+import importlib.util
+
+try:
+    import orjson
+except ImportError:  # Fall back to stdlib json
+    orjson = None
+
+# Use Arrow's multithreaded CSV reader when pyarrow is installed
+CSV_ENGINE = 'pyarrow' if importlib.util.find_spec('pyarrow') else 'c'
 
 # Configure logging
 logging.basicConfig(
@@ -14,10 +23,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Keep in sync with PROJECT_ROOT in orchestration/pipeline_orchestrator.py
+PROJECT_ROOT = Path(os.environ.get('PROJECT_ROOT') or Path(__file__).resolve().parents[2])
+
 class WTIForecaster:
+    # Approximate z-scores for the supported confidence levels
+    Z_SCORES = {0.8: 1.28, 0.65: 0.93, 0.5: 0.67}
+
     def __init__(self):
         """Initialize the WTI price forecaster."""
-        self.project_root = self._get_project_root()
+        self.project_root = PROJECT_ROOT
         
         # Set up paths
         self.models_dir = self.project_root / 'models'
@@ -33,21 +48,17 @@ class WTIForecaster:
         self.base_confidence = 0.8  # 80% base confidence
         self.confidence_decay = 0.15  # 15% decay per month
 
-    def _get_project_root(self):
-        """Get the project root directory."""
-        current_dir = Path(os.getcwd())
-        while not (current_dir / '.env').exists():
-            current_dir = current_dir.parent
-            if current_dir == current_dir.parent:
-                raise FileNotFoundError("Project root not found")
-        return current_dir
+        # The forecast confidence level is fixed, so resolve its z-score once
+        self._forecast_z = self._z_score(self.base_confidence)
 
     def _get_latest_model_dir(self):
         """Get the latest model directory based on timestamp."""
-        model_dirs = [d for d in self.models_dir.iterdir() if d.is_dir() and d.name.startswith('models_')]
+        # YYYYMMDD stamps sort lexicographically, so the max name is the latest
+        with os.scandir(self.models_dir) as entries:
+            model_dirs = [e.name for e in entries if e.is_dir() and e.name.startswith('models_')]
         if not model_dirs:
             raise FileNotFoundError("No model directories found")
-        return max(model_dirs, key=lambda x: x.name.split('_')[1])
+        return self.models_dir / max(model_dirs)
 
     def _load_latest_model(self):
         """Load the latest model and scaler."""
@@ -58,8 +69,9 @@ class WTIForecaster:
             model_path = latest_model_dir / f'best_model_{timestamp}.joblib'
             scaler_path = latest_model_dir / f'scaler_{timestamp}.joblib'
             
-            model = joblib.load(model_path)
-            scaler = joblib.load(scaler_path)
+            # Artifacts are stored uncompressed, so numpy arrays can be memory-mapped
+            model = joblib.load(model_path, mmap_mode='r')
+            scaler = joblib.load(scaler_path, mmap_mode='r')
             
             logger.info(f"Loaded model and scaler from {latest_model_dir}")
             return model, scaler
@@ -71,20 +83,18 @@ class WTIForecaster:
     def _load_latest_training_data(self):
         """Load the latest training data."""
         try:
-            # List all training data files
-            data_files = list(self.data_dir.glob('training_data_*.csv'))
+            # List all training data files in a single directory pass
+            with os.scandir(self.data_dir) as entries:
+                data_files = [e.name for e in entries
+                              if e.name.startswith('training_data_') and e.name.endswith('.csv')]
             if not data_files:
                 raise FileNotFoundError("No training data files found")
                 
-            # Get latest file by comparing the timestamp in filename
-            latest_file = max(data_files, 
-                            key=lambda x: datetime.strptime(
-                                x.name.split('_')[2].split('.')[0], 
-                                '%Y%m%d'
-                            ))
-            
-            # Read the CSV file
-            df = pd.read_csv(latest_file)
+            # Get latest file by its YYYYMMDD timestamp (sorts lexicographically)
+            latest_file = self.data_dir / max(data_files)
+            
+            # Read the CSV file with dates parsed on load
+            df = pd.read_csv(latest_file, engine=CSV_ENGINE, parse_dates=['date'])
             logger.info(f"Loaded training data from {latest_file}")
             return df
             
@@ -93,7 +103,7 @@ class WTIForecaster:
             raise
 
     def _convert_to_serializable(self, obj):
-        """Convert numpy types to Python native types for JSON serialization."""
+        """Convert numpy types to Python native types for stdlib JSON fallback."""
         if isinstance(obj, (np.int8, np.int16, np.int32, np.int64,
                         np.uint8, np.uint16, np.uint32, np.uint64)):
             return int(obj)
@@ -122,48 +132,51 @@ class WTIForecaster:
         confidence = self.base_confidence - (horizon * self.confidence_decay)
         return max(0.1, min(1.0, confidence))  # Clamp between 0.1 and 1.0
 
+    def _z_score(self, confidence):
+        """Z-score of the supported confidence level closest to confidence."""
+        closest_conf = min(self.Z_SCORES, key=lambda x: abs(x - confidence))
+        return self.Z_SCORES[closest_conf]
+
     def _calculate_error_margin(self, confidence, std_dev):
         """Calculate error margin based on confidence and historical volatility."""
-        # Use historical volatility (std dev) and confidence to estimate margin
-        z_score = {0.8: 1.28, 0.65: 0.93, 0.5: 0.67}  # Approximate z-scores
-        closest_conf = min(z_score.keys(), key=lambda x: abs(x - confidence))
-        return z_score[closest_conf] * std_dev
+        return self._z_score(confidence) * std_dev
 
     def generate_forecast(self):
         """Generate WTI price forecasts for the next 1 month."""
         try:
-            # Load latest model and data
-            current_data = self._load_latest_training_data()
+            # Reuse training data loaded at initialization
+            current_data = self.training_data
             
             # Get current WTI price (most recent value)
-            current_wti = current_data['wti'].iloc[-1]
+            current_wti = current_data['wti'].iat[-1]
             
-            # Prepare features for prediction
-            forecast_features = self._prepare_features(current_data)
-            X_forecast = self.scaler.transform(forecast_features.iloc[-1:])
+            # Prepare features for prediction (latest row only). Kept as a DataFrame
+            # because the scaler was fitted with feature names.
+            forecast_features = self._prepare_features(current_data.iloc[-1:])
+            X_forecast = self.scaler.transform(forecast_features)
             
             # Make prediction
-            prediction = float(self.model.predict(X_forecast)[0])
+            prediction = self.model.predict(X_forecast)[0]
             
             # Calculate confidence interval
-            std_dev = current_data['wti'].std()
-            error_margin = 1.28 * std_dev  # For 80% confidence
+            std_dev = current_data['wti'].to_numpy().std(ddof=1)
+            error_margin = self._forecast_z * std_dev
             
             # Generate forecast date
-            last_date = pd.to_datetime(current_data['date'].iloc[-1])
+            last_date = current_data['date'].iloc[-1]  # Parsed on load
             forecast_date = (last_date + pd.DateOffset(months=1)).strftime('%Y-%m-%d')
             
             # Prepare results
             forecast_results = {
-                'current_wti': float(current_wti),
+                'current_wti': current_wti,
                 'forecast': {
                     'forecast_date': forecast_date,
                     'predicted_price': prediction,
                     'confidence_interval': {
-                        'lower': float(prediction - error_margin),
-                        'upper': float(prediction + error_margin)
+                        'lower': prediction - error_margin,
+                        'upper': prediction + error_margin
                     },
-                    'confidence': 80.0
+                    'confidence': self.base_confidence * 100
                 }
             }
             
@@ -171,8 +184,15 @@ class WTIForecaster:
             timestamp = datetime.now().strftime('%Y%m%d')
             output_file = self.output_dir / f'wti_forecast_{timestamp}.json'
             
-            with open(output_file, 'w') as f:
-                json.dump(forecast_results, f, indent=4)
+            if orjson is not None:
+                output_file.write_bytes(orjson.dumps(
+                    forecast_results,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                ))
+            else:
+                with open(output_file, 'w') as f:
+                    json.dump(forecast_results, f, indent=2,
+                              default=self._convert_to_serializable)
                 
             logger.info(f"Generated and saved 1-month forecasts to {output_file}")
             return forecast_results
@@ -181,7 +201,7 @@ class WTIForecaster:
             logger.error(f"Error generating forecasts: {str(e)}")
             raise
 
-if __name__ == "__main__":
+def main():
     try:
         forecaster = WTIForecaster()
         forecast = forecaster.generate_forecast()
@@ -197,4 +217,7 @@ if __name__ == "__main__":
             
     except Exception as e:
         logger.error(f"Forecasting pipeline failed: {str(e)}")
-        raise
\ No newline at end of file
+        raise
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
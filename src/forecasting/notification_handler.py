@@ -1,11 +1,15 @@
 import os
 import json
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from datetime import datetime
+from email.message import EmailMessage
 from pathlib import Path
 import logging
+import string
+
+try:
+    import orjson
+except ImportError:  # Fall back to stdlib json
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -14,77 +18,33 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-class NotificationHandler:
-    def __init__(self):
-        """Initialize notification handler."""
-        self.project_root = self._get_project_root()
-        self.forecasts_dir = self.project_root / 'results' / 'forecasts'
-        
-        # Email configuration
-        self.sender_email = os.getenv('SENDER_EMAIL')
-        self.sender_password = os.getenv('SENDER_PASSWORD')
-        self.recipient_email = os.getenv('RECIPIENT_EMAIL')
-        self.smtp_server = "smtp.gmail.com"
-        self.smtp_port = 587
-
-    def _get_project_root(self):
-        """Get the project root directory."""
-        current_dir = Path(os.getcwd())
-        while not (current_dir / '.env').exists():
-            current_dir = current_dir.parent
-            if current_dir == current_dir.parent:
-                raise FileNotFoundError("Project root not found")
-        return current_dir
-
-    def _get_latest_forecast(self):
-        """Get the latest forecast JSON file."""
-        try:
-            json_files = list(self.forecasts_dir.glob('wti_forecast_*.json'))
-            if not json_files:
-                raise FileNotFoundError("No forecast files found")
-                
-            latest_file = max(json_files, key=lambda x: x.stat().st_mtime)
-            
-            with open(latest_file, 'r') as f:
-                forecast_data = json.load(f)
-                
-            logger.info(f"Loaded latest forecast from {latest_file}")
-            return forecast_data
-            
-        except Exception as e:
-            logger.error(f"Error loading forecast data: {str(e)}")
-            raise
-
-    def _create_email_content(self, forecast_data):
-        """Create HTML email content with forecast data."""
-        forecast = forecast_data['forecast']
-        
-        html_content = f"""
+# HTML email skeleton, built once at import; rows are substituted per email
+_HTML_SKELETON = string.Template("""
         <html>
         <head>
             <style>
-                table {{
+                table {
                     border-collapse: collapse;
                     width: 100%;
                     margin: 20px 0;
-                }}
-                th, td {{
+                }
+                th, td {
                     border: 1px solid #ddd;
                     padding: 8px;
                     text-align: left;
-                }}
-                th {{
+                }
+                th {
                     background-color: #f2f2f2;
-                }}
-                .header {{
+                }
+                .header {
                     color: #333;
                     margin-bottom: 20px;
-                }}
-                .current-price {{
+                }
+                .current-price {
                     font-size: 18px;
                     color: #333;
                     margin: 20px 0;
-                }}
+                }
             </style>
         </head>
         <body>
@@ -93,7 +53,7 @@ class NotificationHandler:
             </div>
             
             <div class="current-price">
-                Current WTI Price: ${forecast_data['current_wti']:.2f}
+                Current WTI Price: $$${current_wti}
             </div>
             
             <table>
@@ -102,60 +62,128 @@ class NotificationHandler:
                     <th>Predicted Price</th>
                     <th>Range</th>
                     <th>Confidence</th>
-                </tr>
-                <tr>
-                    <td>{forecast['forecast_date']}</td>
-                    <td>${forecast['predicted_price']:.2f}</td>
-                    <td>${forecast['confidence_interval']['lower']:.2f} - ${forecast['confidence_interval']['upper']:.2f}</td>
-                    <td>{forecast['confidence']:.1f}%</td>
-                </tr>
+                </tr>$rows
             </table>
         </body>
         </html>
-        """
-        return html_content
+        """)
+
+# Keep in sync with PROJECT_ROOT in orchestration/pipeline_orchestrator.py
+PROJECT_ROOT = Path(os.environ.get('PROJECT_ROOT') or Path(__file__).resolve().parents[2])
+
+class NotificationHandler:
+    # HTML table row for a single forecast entry
+    ROW_TEMPLATE = """
+                <tr>
+                    <td>{forecast_date}</td>
+                    <td>${predicted_price:.2f}</td>
+                    <td>${lower:.2f} - ${upper:.2f}</td>
+                    <td>{confidence:.1f}%</td>
+                </tr>"""
+
+    def __init__(self):
+        """Initialize notification handler."""
+        self.project_root = PROJECT_ROOT
+        self.forecasts_dir = self.project_root / 'results' / 'forecasts'
+        
+        # Email configuration
+        self.sender_email = os.getenv('SENDER_EMAIL')
+        self.sender_password = os.getenv('SENDER_PASSWORD')
+        self.recipient_email = os.getenv('RECIPIENT_EMAIL')
+        # RECIPIENT_EMAIL may hold a comma-separated list of addresses
+        self.recipients = [r.strip() for r in (self.recipient_email or '').split(',') if r.strip()]
+        self.smtp_server = "smtp.gmail.com"
+        self.smtp_port = 587
+
+        # Validate email configuration up front, before any SMTP handshake
+        if not all([self.sender_email, self.sender_password, self.recipient_email]):
+            raise ValueError("Missing required email configuration. Check SENDER_EMAIL, SENDER_PASSWORD and RECIPIENT_EMAIL in .env file")
+        if not self.recipients or any('@' not in r for r in self.recipients):
+            raise ValueError(f"Invalid recipient email address: {self.recipient_email}")
+
+    def _get_latest_forecast(self):
+        """Get the latest forecast JSON file."""
+        try:
+            with os.scandir(self.forecasts_dir) as entries:
+                json_files = [e.name for e in entries
+                              if e.name.startswith('wti_forecast_') and e.name.endswith('.json')]
+            if not json_files:
+                raise FileNotFoundError("No forecast files found")
+                
+            # Names embed a YYYYMMDD stamp, so the max name is the newest (no stat calls)
+            latest_file = self.forecasts_dir / max(json_files)
+            
+            if orjson is not None:
+                forecast_data = orjson.loads(latest_file.read_bytes())
+            else:
+                with open(latest_file, 'r') as f:
+                    forecast_data = json.load(f)
+                
+            logger.info("Loaded latest forecast from %s", latest_file)
+            return forecast_data
+            
+        except Exception as e:
+            logger.error("Error loading forecast data: %s", e)
+            raise
+
+    def _create_email_content(self, forecast_data):
+        """Create HTML email content with forecast data."""
+        # A single 'forecast' entry today; a 'forecasts' list renders one row each
+        forecasts = forecast_data.get('forecasts') or [forecast_data['forecast']]
+        row = self.ROW_TEMPLATE.format
+        rows = "".join(
+            row(forecast_date=f['forecast_date'],
+                predicted_price=f['predicted_price'],
+                lower=f['confidence_interval']['lower'],
+                upper=f['confidence_interval']['upper'],
+                confidence=f['confidence'])
+            for f in forecasts
+        )
+        return _HTML_SKELETON.substitute(
+            current_wti=f"{forecast_data['current_wti']:.2f}",
+            rows=rows
+        )
 
     def send_notification(self):
         """Send email notification with forecast data."""
         try:
-            # Validate email configuration
-            if not all([self.sender_email, self.sender_password, self.recipient_email]):
-                raise ValueError("Missing required email configuration. Check SENDER_EMAIL, SENDER_PASSWORD and RECIPIENT_EMAIL in .env file")
-
             # Get forecast data
             forecast_data = self._get_latest_forecast()
             
             # Create email message
-            msg = MIMEMultipart('alternative')
+            msg = EmailMessage()
             msg['Subject'] = "WTI Price Prediction Update"
             msg['From'] = self.sender_email
-            msg['To'] = self.recipient_email
+            msg['To'] = ', '.join(self.recipients)
             
-            # Add HTML content
+            # Add plain-text fallback and HTML alternative
             html_content = self._create_email_content(forecast_data)
-            msg.attach(MIMEText(html_content, 'html'))
+            msg.set_content(
+                f"WTI Price Forecast Update\n\n"
+                f"Current WTI Price: ${forecast_data['current_wti']:.2f}\n"
+                f"View this email in an HTML-capable client for the full forecast."
+            )
+            msg.add_alternative(html_content, subtype='html')
             
-            # Send email
+            # Send email; one SMTP transaction delivers to every recipient
             with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
                 server.starttls()
                 server.login(self.sender_email, self.sender_password)
-                
-                # Validate recipient email
-                if not self.recipient_email or '@' not in self.recipient_email:
-                    raise ValueError(f"Invalid recipient email address: {self.recipient_email}")
+                server.send_message(msg, to_addrs=self.recipients)
                     
-                server.send_message(msg)
-                    
-            logger.info(f"Successfully sent forecast notification email to {self.recipient_email}")
+            logger.info("Successfully sent forecast notification email to %s", self.recipient_email)
                 
         except Exception as e:
-            logger.error(f"Error sending notification: {str(e)}")
+            logger.error("Error sending notification: %s", e)
             raise
 
-if __name__ == "__main__":
+def main():
     try:
         handler = NotificationHandler()
         handler.send_notification()
     except Exception as e:
-        logger.error(f"Notification pipeline failed: {str(e)}")
-        raise
\ No newline at end of file
+        logger.error("Notification pipeline failed: %s", e)
+        raise
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -4,6 +4,8 @@ import joblib
 import logging
 import os
 from datetime import datetime
+import matplotlib
+matplotlib.use('Agg')  # Headless pipeline: render straight to files, no GUI backend
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
@@ -101,10 +103,11 @@ class ModelTrainer:
             if missing_features:
                 raise ValueError(f"Missing required features: {missing_features}")
             
+            # Keep X as a DataFrame: the scaler was fitted with feature names and checks them
             X = df[features]
-            y = df['wti']
+            y = df['wti'].to_numpy(dtype=np.float64)
             
-            # Load and apply scaler
+            # Load and apply scaler; the output is already a contiguous float64 ndarray
             scaler = joblib.load(self.scaler_path)
             X_scaled = scaler.transform(X)
             
@@ -121,9 +124,26 @@ class ModelTrainer:
             logger.error(f"Error in data preparation: {str(e)}")
             raise
 
+    @staticmethod
+    def _mape(y_true, y_pred):
+        """Mean absolute percentage error, computed in a single reused buffer."""
+        buf = np.subtract(y_true, y_pred)
+        np.divide(buf, y_true, out=buf)
+        np.abs(buf, out=buf)
+        return buf.mean() * 100
+
+    @staticmethod
+    def _directional_accuracy(y_true, y_pred):
+        """Share of steps where predicted and actual moves have the same sign."""
+        return np.mean(np.sign(np.diff(y_true)) == np.sign(np.diff(y_pred))) * 100
+
     def train_model(self, X_train, X_test, y_train, y_test):
         """Train model and calculate metrics."""
         try:
+            # Work on contiguous float64 arrays rather than index-aligned Series
+            y_train = np.ascontiguousarray(y_train, dtype=np.float64)
+            y_test = np.ascontiguousarray(y_test, dtype=np.float64)
+            
             logger.info("Loading and training model...")
             model = joblib.load(self.model_path)
             model.fit(X_train, y_train)
@@ -138,12 +158,10 @@ class ModelTrainer:
                 'test_rmse': np.sqrt(mean_squared_error(y_test, y_pred_test)),
                 'train_mae': mean_absolute_error(y_train, y_pred_train),
                 'test_mae': mean_absolute_error(y_test, y_pred_test),
-                'train_mape': np.mean(np.abs((y_train - y_pred_train) / y_train)) * 100,
-                'test_mape': np.mean(np.abs((y_test - y_pred_test) / y_test)) * 100,
-                'train_da': np.mean(np.sign(np.diff(y_train)) == 
-                                  np.sign(np.diff(y_pred_train))) * 100,
-                'test_da': np.mean(np.sign(np.diff(y_test)) == 
-                                 np.sign(np.diff(y_pred_test))) * 100
+                'train_mape': self._mape(y_train, y_pred_train),
+                'test_mape': self._mape(y_test, y_pred_test),
+                'train_da': self._directional_accuracy(y_train, y_pred_train),
+                'test_da': self._directional_accuracy(y_test, y_pred_test)
             }
             
             return model, metrics, (y_pred_train, y_pred_test)
@@ -152,6 +170,25 @@ class ModelTrainer:
             logger.error(f"Error in model training: {str(e)}")
             raise
 
+    def _plot_predictions(self, fig, ax, dates, actual, predicted, title, filename):
+        """Draw actual vs predicted prices on a reused figure and save it."""
+        ax.clear()
+        ax.plot(dates, actual, label='Actual', color='blue')
+        ax.plot(dates, predicted, label='Predicted', color='red', linestyle='--')
+        ax.set_title(f'{title}: Actual vs Predicted WTI Prices\nGenerated: {self.datestamp}')
+        ax.set_xlabel('Date')
+        ax.set_ylabel('Price (USD)')
+
+        # Format x-axis to show only year and month, one tick per year
+        ax.xaxis.set_major_locator(mdates.YearLocator(1))
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
+        plt.setp(ax.get_xticklabels(), rotation=0, ha='right')  # Align the tick labels
+        ax.grid(True, alpha=0.3)  # Add light grid
+        ax.margins(x=0.02)  # Reduce blank space on sides
+        ax.legend(loc='upper right')
+        fig.tight_layout()
+        fig.savefig(os.path.join(self.plots_dir, filename))
+
     def save_results(self, metrics, dates, y_train, y_test, y_pred_train, y_pred_test):
         """Save metrics and generate plots with date stamp."""
         try:
@@ -170,54 +207,20 @@ class ModelTrainer:
                 f.write(f"MAPE: {metrics['test_mape']:.2f}%\n")
                 f.write(f"Directional Accuracy: {metrics['test_da']:.2f}%\n")
             
-            # Generate plots
-            split_idx = len(y_train)
-            dates_train = dates[:split_idx]
-            dates_test = dates[split_idx:]
-
-            # Convert dates to datetime if they aren't already
+            # Generate plots; convert dates to datetime once, then split
+            dates_all = pd.to_datetime(dates)
             split_idx = len(y_train)
-            dates_train = pd.to_datetime(dates[:split_idx])
-            dates_test = pd.to_datetime(dates[split_idx:])
-
-
-            # Training predictions plot
-            plt.figure(figsize=(12, 6))
-            plt.plot(dates_train, y_train, label='Actual', color='blue')
-            plt.plot(dates_train, y_pred_train, label='Predicted', color='red', linestyle='--')
-            plt.title(f'Training Set: Actual vs Predicted WTI Prices\nGenerated: {self.datestamp}')
-            plt.xlabel('Date')
-            plt.ylabel('Price (USD)')
-
-            # Format x-axis to show only year and month
-            plt.gca().xaxis.set_major_locator(mdates.YearLocator(1))  # Show every 2 years
-            plt.gca().xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-            plt.xticks(rotation=0, ha='right')  # Rotate and align the tick labels
-            plt.grid(True, alpha=0.3)  # Add light grid
-            plt.margins(x=0.02)  # Reduce blank space on sides
-            plt.legend(loc='upper right')
-            plt.tight_layout()
-            plt.savefig(os.path.join(self.plots_dir, f'training_predictions_{self.datestamp}.png'))
-            plt.close()
-
-            # Test predictions plot (similar modifications)
-            plt.figure(figsize=(12, 6))
-            plt.plot(dates_test, y_test, label='Actual', color='blue')
-            plt.plot(dates_test, y_pred_test, label='Predicted', color='red', linestyle='--')
-            plt.title(f'Test Set: Actual vs Predicted WTI Prices\nGenerated: {self.datestamp}')
-            plt.xlabel('Date')
-            plt.ylabel('Price (USD)')
-
-            # Format x-axis to show only year and month
-            plt.gca().xaxis.set_major_locator(mdates.YearLocator(1))  # Show every year for test set
-            plt.gca().xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-            plt.xticks(rotation=0, ha='right')
-            plt.grid(True, alpha=0.3)
-            plt.margins(x=0.02)
-            plt.legend(loc='upper right')
-            plt.tight_layout()
-            plt.savefig(os.path.join(self.plots_dir, f'test_predictions_{self.datestamp}.png'))
-            plt.close()
+            dates_train, dates_test = dates_all[:split_idx], dates_all[split_idx:]
+
+            # Training and test predictions plots share one figure
+            fig, ax = plt.subplots(figsize=(12, 6))
+            try:
+                self._plot_predictions(fig, ax, dates_train, y_train, y_pred_train,
+                                       'Training Set', f'training_predictions_{self.datestamp}.png')
+                self._plot_predictions(fig, ax, dates_test, y_test, y_pred_test,
+                                       'Test Set', f'test_predictions_{self.datestamp}.png')
+            finally:
+                plt.close(fig)
             
             logger.info(f"Results saved with datestamp {self.datestamp}")
             logger.info(f"Metrics saved to {metrics_file}")
@@ -1,17 +1,20 @@
 """
 Pipeline orchestrator script that coordinates the execution of data pipeline components.
+Each component script is imported once and its main() run in-process, so heavy
+dependencies (pandas, sklearn, xgboost) are loaded a single time per run.
 Scheduled to run every Thursday at 5 PM Chicago time.
 """
 
 import os
 import sys
+import importlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-import subprocess
 import schedule
 import time
-import pytz
 from datetime import datetime
 import logging
+from zoneinfo import ZoneInfo
 
 # Create logs directory if it doesn't exist
 current_dir = Path(__file__).parent
@@ -29,10 +32,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Project root (two levels up from src/<package>/), overridable via PROJECT_ROOT.
+# Standalone scripts can't import across src/ packages, so model_forecast.py and
+# notification_handler.py repeat this definition; keep the three in sync.
+PROJECT_ROOT = Path(os.environ.get('PROJECT_ROOT') or Path(__file__).resolve().parents[2])
+
 class PipelineOrchestrator:
     def __init__(self):
         """Initialize orchestrator with project paths."""
-        self.project_root = self._get_project_root()
+        self.project_root = PROJECT_ROOT
+        # Stage scripts resolve data paths relative to the project root; set it
+        # once here rather than per stage (collectors run on worker threads)
+        os.chdir(str(self.project_root))
         
         # Set up paths for different components
         self.src_dir = self.project_root / 'src'
@@ -44,43 +55,28 @@ class PipelineOrchestrator:
         self.logs_dir = self.project_root / 'logs'
         self.logs_dir.mkdir(exist_ok=True)
 
-    def _get_project_root(self):
-        """Get the project root directory by traversing up until finding .env file."""
-        current_dir = Path(os.getcwd())
-        while not (current_dir / '.env').exists():
-            parent = current_dir.parent
-            if parent == current_dir:
-                raise FileNotFoundError("Project root not found (no .env file)")
-            current_dir = parent
-        return current_dir
+    def _load_script(self, script_path):
+        """Import a pipeline script as a module (cached by Python after the first load)."""
+        # Scripts import their siblings directly (e.g. `from utils import ...`)
+        script_dir = str(script_path.parent)
+        if script_dir not in sys.path:
+            sys.path.insert(0, script_dir)
+        return importlib.import_module(script_path.stem)
 
     def run_script(self, script_path, script_name):
-        """Execute a Python script and handle errors."""
+        """Run a pipeline script's main() in-process and handle errors."""
         try:
-            logger.info(f"Starting {script_name}")
+            logger.info("Starting %s", script_name)
             start_time = time.time()
             
-            # Set working directory to project root before running script
-            os.chdir(str(self.project_root))
-            
-            result = subprocess.run(
-                [sys.executable, str(script_path)],
-                check=True,
-                capture_output=True,
-                text=True,
-                cwd=str(self.project_root)  # Set working directory for subprocess
-            )
+            self._load_script(script_path).main()
             
             execution_time = time.time() - start_time
-            logger.info(f"Successfully completed {script_name} in {execution_time:.2f} seconds")
+            logger.info("Successfully completed %s in %.2f seconds", script_name, execution_time)
             return True
             
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Error running {script_name}: {str(e)}")
-            logger.error(f"Script output: {e.output}")
-            return False
         except Exception as e:
-            logger.error(f"Unexpected error running {script_name}: {str(e)}")
+            logger.error("Error running %s: %s", script_name, e)
             return False
 
     def run_collection_pipeline(self):
@@ -93,10 +89,18 @@ class PipelineOrchestrator:
         ]
 
         logger.info("Starting data collection pipeline")
-        for script_path, script_name in collection_scripts:
-            if not self.run_script(script_path, script_name):
-                logger.error(f"Collection pipeline failed at {script_name}")
-                return False
+        # Collectors are independent and network-bound, so run them concurrently
+        with ThreadPoolExecutor(max_workers=len(collection_scripts)) as pool:
+            futures = {
+                pool.submit(self.run_script, script_path, script_name): script_name
+                for script_path, script_name in collection_scripts
+            }
+            for future in as_completed(futures):
+                if not future.result():
+                    # Every collector already has a worker, so nothing is left to cancel;
+                    # leaving the with-block waits for in-flight collectors before returning
+                    logger.error("Collection pipeline failed at %s", futures[future])
+                    return False
         logger.info("Data collection pipeline completed successfully")
         return True
 
@@ -110,7 +114,7 @@ class PipelineOrchestrator:
         logger.info("Starting data processing pipeline")
         for script_path, script_name in processing_scripts:
             if not self.run_script(script_path, script_name):
-                logger.error(f"Processing pipeline failed at {script_name}")
+                logger.error("Processing pipeline failed at %s", script_name)
                 return False
         logger.info("Data processing pipeline completed successfully")
         return True
@@ -125,7 +129,7 @@ class PipelineOrchestrator:
         logger.info("Starting forecasting pipeline")
         for script_path, script_name in forecasting_scripts:
             if not self.run_script(script_path, script_name):
-                logger.error(f"Forecasting pipeline failed at {script_name}")
+                logger.error("Forecasting pipeline failed at %s", script_name)
                 return False
         logger.info("Forecasting pipeline completed successfully")
         return True
@@ -133,9 +137,9 @@ class PipelineOrchestrator:
     def run_full_pipeline(self):
         """Execute the complete pipeline from collection to notification."""
         try:
-            chicago_tz = pytz.timezone('America/Chicago')
+            chicago_tz = ZoneInfo('America/Chicago')
             current_time = datetime.now(chicago_tz)
-            logger.info(f"Starting full pipeline execution at {current_time}")
+            logger.info("Starting full pipeline execution at %s", current_time)
 
             # Execute each pipeline stage
             stages = [
@@ -145,17 +149,17 @@ class PipelineOrchestrator:
             ]
 
             for stage_func, stage_name in stages:
-                logger.info(f"Starting pipeline stage: {stage_name}")
+                logger.info("Starting pipeline stage: %s", stage_name)
                 if not stage_func():
                     raise Exception(f"Pipeline failed during {stage_name}")
-                logger.info(f"Completed pipeline stage: {stage_name}")
+                logger.info("Completed pipeline stage: %s", stage_name)
 
             execution_time = time.time() - current_time.timestamp()
-            logger.info(f"Full pipeline completed successfully in {execution_time:.2f} seconds")
+            logger.info("Full pipeline completed successfully in %.2f seconds", execution_time)
             return True
 
         except Exception as e:
-            logger.error(f"Pipeline failed: {str(e)}")
+            logger.error("Pipeline failed: %s", e)
             return False
 
 def main():
@@ -173,12 +177,14 @@ def main():
         logger.info("Press Ctrl+C to stop the scheduler")
         while True:
             schedule.run_pending()
-            time.sleep(60)
+            # Sleep until the next scheduled run instead of polling every minute, waking at
+            # least hourly so DST shifts or a suspended host only delay a run by that much
+            time.sleep(min(max(1, schedule.idle_seconds()), 3600))
             
     except KeyboardInterrupt:
         logger.info("Scheduler stopped by user")
     except Exception as e:
-        logger.error(f"Scheduler failed: {str(e)}")
+        logger.error("Scheduler failed: %s", e)
         raise
 
 if __name__ == "__main__":
@@ -0,0 +1,65 @@
+"""
+CSV input/output helpers shared by the data and feature processors.
+
+write_csv serialises through pyarrow's multithreaded writer when it is installed
+and produces the same text as DataFrame.to_csv(index=False); otherwise it falls
+back to pandas. CSV_ENGINE selects the matching read_csv engine.
+"""
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+except ImportError:  # Fall back to pandas' CSV reader and writer
+    pa = None
+
+# read_csv engine for the processors: Arrow's parser when available, else pandas' C parser
+CSV_ENGINE = 'pyarrow' if pa is not None else 'c'
+
+
+def _float_as_text(column):
+    """Format a float column as text, keeping the trailing .0 pandas writes for integral values."""
+    text = pc.cast(column, pa.string())
+    integral = pc.and_(
+        pc.and_(pc.is_finite(column), pc.equal(column, pc.floor(column))),
+        pc.invert(pc.match_substring(text, 'e'))
+    )
+    return pc.if_else(integral, pc.binary_join_element_wise(text, '.0', ''), text)
+
+
+def _to_csv_table(df):
+    """Convert df to an Arrow table laid out like pandas' CSV output, or None if it cannot be."""
+    if any(',' in str(col) or '"' in str(col) for col in df.columns):
+        return None  # Header would need quoting
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    for i, field in enumerate(table.schema):
+        column = table.column(i)
+        if pa.types.is_floating(field.type):
+            # pyarrow writes 1473.0 as 1473, which readers would then infer as int
+            column = _float_as_text(column)
+        elif pa.types.is_timestamp(field.type) and field.type.tz is None:
+            # Midnight timestamps are written as plain YYYY-MM-DD, as pandas does
+            dates = column.cast(pa.date32(), safe=False)
+            if not pc.all(pc.equal(dates.cast(field.type), column)).as_py():
+                return None
+            column = dates
+        elif not pa.types.is_integer(field.type):
+            # Strings, booleans etc. are formatted or quoted differently by pyarrow
+            return None
+        table = table.set_column(i, field.name, column)
+
+    return table
+
+
+def write_csv(df, path):
+    """Write df to CSV without the index, using pyarrow's writer when available."""
+    table = _to_csv_table(df) if pa is not None else None
+    if table is None:
+        df.to_csv(path, index=False)
+        return
+
+    # Plain header line, and no quoting: only numbers and dates are left, which never need it
+    with open(path, 'wb') as f:
+        f.write((','.join(map(str, df.columns)) + '\n').encode())
+        pa_csv.write_csv(table, f, pa_csv.WriteOptions(include_header=False, quoting_style='none'))
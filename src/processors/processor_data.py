@@ -5,7 +5,8 @@ import re
 from datetime import datetime
 import logging
 import os
-import shutil
+
+from csv_io import write_csv
 
 # Set up logging
 logging.basicConfig(
@@ -14,6 +15,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# The hot path here is memory-bound: a few hundred monthly rows, ~10k daily rows before
+# resampling. Gains come from fewer passes over the data and no upsampled intermediates,
+# not from micro-optimising arithmetic. Each frequency branch below does at most one
+# resample and, unless the source has gaps, one fill.
 class DataProcessor:
     def __init__(self, raw_data_dir='data/raw', output_dir='data/processed'):
         """Initialize the data processor with directory paths."""
@@ -48,38 +53,54 @@ class DataProcessor:
             'gdp': 'Q',       # Quarterly
             'inflation': 'M'   # Monthly
         }
+        
+        # Precompiled raw file patterns (YYYYMMDD format) and latest-file cache
+        self._latest_re = {name: re.compile(f"{re.escape(name)}_\\d{{8}}\\.csv")
+                           for name in self.column_mapping}
+        self._latest_cache = {}
+
+    def _scan_raw_files(self):
+        """Bucket raw files by base name in a single directory scan and cache the latest of each."""
+        buckets = {name: [] for name in self.column_mapping}
+        with os.scandir(self.raw_data_dir) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                for name, pattern in self._latest_re.items():
+                    if pattern.fullmatch(entry.name):
+                        buckets[name].append(entry)
+                        break
+        
+        for name, files in buckets.items():
+            if files:
+                latest = max(files, key=lambda e: e.stat().st_mtime)
+                self._latest_cache[name] = Path(latest.path)
 
     def get_latest_file(self, base_name):
         """Find the latest file for a given base name using timestamp in filename."""
-        # Pattern to match YYYYMMDD format
-        pattern = f"{base_name}_\\d{{8}}\\.csv$"
-        matching_files = [f for f in self.raw_data_dir.glob(f"{base_name}_*.csv") 
-                        if re.match(pattern, f.name)]
+        if base_name not in self._latest_cache:
+            self._scan_raw_files()
         
-        if not matching_files:
+        latest_file = self._latest_cache.get(base_name)
+        if latest_file is None:
             raise FileNotFoundError(f"No matching files found for {base_name}")
             
-        latest_file = max(matching_files, key=lambda x: x.stat().st_mtime)
         logger.info(f"Found latest file for {base_name}: {latest_file.name}")
         return latest_file
 
     def load_and_clean_data(self, file_path, base_name):
         """Load CSV data and perform initial cleaning."""
         try:
-            df = pd.read_csv(file_path)
+            # Read the header only to locate the date and value columns
+            header = pd.read_csv(file_path, nrows=0).columns
+            date_col = [col for col in header if 'date' in col.strip().lower()][0]
+            value_col = [col for col in header if col != date_col][0]
             
-            # Basic cleaning
-            df.columns = df.columns.str.strip().str.lower()
+            # Load just those two columns, parsed and typed by the reader
+            df = pd.read_csv(file_path, usecols=[date_col, value_col],
+                             parse_dates=[date_col], dtype={value_col: 'float64'})
             df = df.dropna(how='all')
-            
-            # Ensure date column exists and is properly formatted
-            date_col = [col for col in df.columns if 'date' in col.lower()][0]
-            df[date_col] = pd.to_datetime(df[date_col])
-            df = df.rename(columns={date_col: 'date'})
-            
-            # Rename target column according to mapping
-            value_col = [col for col in df.columns if col != 'date'][0]
-            df = df.rename(columns={value_col: self.column_mapping[base_name]})
+            df = df.rename(columns={date_col: 'date', value_col: self.column_mapping[base_name]})
             
             logger.info(f"Successfully loaded and cleaned {base_name} data")
             return df
@@ -88,6 +109,39 @@ class DataProcessor:
             logger.error(f"Error processing {file_path}: {str(e)}")
             raise
 
+    def _weekly_to_monthly(self, series):
+        """Monthly mean of the daily linear interpolant of a weekly series, without building the daily grid."""
+        series = series.sort_index()
+        days = series.index.values.astype('datetime64[D]')
+        months = np.arange(days[0].astype('datetime64[M]'), days[-1].astype('datetime64[M]') + 1)
+        month_starts = months.astype('datetime64[D]').astype(np.int64)
+        
+        # Interpolation knots (valid weekly points) as day numbers
+        valid = series.notna().to_numpy()
+        x = days[valid].astype(np.int64)
+        v = series.to_numpy(dtype=np.float64)[valid]
+        
+        sums = np.zeros(len(months))
+        counts = np.zeros(len(months))
+        if len(x):
+            # Split the covered days into pieces that are linear and lie within a single month;
+            # the sum of a linear run of days is its length times the mean of its endpoints
+            first, last = x[0], days[-1].astype(np.int64)
+            inner = month_starts[(month_starts > first) & (month_starts <= last)]
+            edges = np.unique(np.concatenate([x, inner, [first, last + 1]]))
+            start, length = edges[:-1], np.diff(edges)
+            piece_sums = length * (np.interp(start, x, v) + np.interp(start + length - 1, x, v)) / 2
+            
+            month_idx = np.searchsorted(month_starts, start, side='right') - 1
+            sums = np.bincount(month_idx, weights=piece_sums, minlength=len(months))
+            counts = np.bincount(month_idx, weights=length, minlength=len(months))
+        
+        # Months without any interpolated day stay NaN
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = sums / counts
+        return pd.Series(means, index=pd.DatetimeIndex(months.astype('datetime64[ns]'), name='date'),
+                         name=series.name)
+
     def standardize_to_monthly(self, df, base_name):
         """Convert data to monthly frequency with proper handling based on original frequency."""
         freq = self.frequencies[base_name]
@@ -99,14 +153,15 @@ class DataProcessor:
             df = df.resample('M').mean()
             
         elif freq == 'W':  # Weekly to Monthly
-            # First resample to daily to handle missing weeks
-            df = df.resample('D').interpolate(method='linear')
-            # Then resample to monthly
-            df = df.resample('M').mean()
+            # Same as daily linear interpolation followed by a monthly mean, computed directly
+            df = pd.DataFrame({col: self._weekly_to_monthly(df[col]) for col in df.columns})
             
         elif freq == 'Q':  # Quarterly to Monthly
-            # Interpolate to monthly
-            df = df.resample('M').ffill().interpolate(method='linear')          
+            # Carry each quarter forward over its months
+            df = df.resample('M').ffill()
+            # Interpolate only when a quarterly value itself was missing
+            if df.isna().to_numpy().any():
+                df = df.interpolate(method='linear')
           
         # Reset index and ensure date is first of month
         df = df.reset_index()
@@ -117,17 +172,20 @@ class DataProcessor:
 
     def validate_data(self, df):
         """Perform validation checks on the final dataset."""
+        # Dates as day numbers; the dataset is sorted by date at this point
+        days = df['date'].to_numpy(dtype='datetime64[D]').astype(np.int64)
+        date_diff = np.diff(days)
+        
         # Check date frequency
-        date_diff = df['date'].diff().dropna()
-        if not all(date_diff.dt.days.between(28, 31)):
+        if not ((date_diff >= 28) & (date_diff <= 31)).all():
             raise ValueError("Inconsistent monthly frequency detected")
             
         # Check for duplicate dates
-        if df['date'].duplicated().any():
+        if (date_diff == 0).any():
             raise ValueError("Duplicate dates found in dataset")
             
         # Check for future dates
-        if (df['date'] > pd.Timestamp.now()).any():
+        if len(days) and days.max() > np.datetime64('today', 'D').astype(np.int64):
             raise ValueError("Future dates found in dataset")
             
         logger.info("Data validation passed successfully")
@@ -146,7 +204,9 @@ class DataProcessor:
                 try:
                     raw_file = self.get_latest_file(base_name)
                     archive_path = date_archive_dir / raw_file.name
-                    shutil.move(str(raw_file), str(archive_path))
+                    # Archive lives under the raw directory, so this is a single same-filesystem rename
+                    raw_file.replace(archive_path)
+                    self._latest_cache.pop(base_name, None)
                     logger.info(f"Archived {raw_file.name} to {archive_path}")
                 except Exception as e:
                     logger.error(f"Error archiving {base_name} file: {str(e)}")
@@ -176,10 +236,11 @@ class DataProcessor:
                 
                 all_data.append(df)
             
-            # Merge all datasets
-            final_df = all_data[0]
-            for df in all_data[1:]:
-                final_df = pd.merge(final_df, df, on='date', how='outer')
+            # Merge all datasets with a single outer concat on the month-start date index
+            final_df = pd.concat([df.set_index('date') for df in all_data],
+                                 axis=1, join='outer').sort_index()
+            final_df.index.name = 'date'
+            final_df = final_df.reset_index()
                 
             # Filter date range to start from 2005-01-01
             final_df = final_df[final_df['date'] >= '2005-01-01'] # Because earliest data in raw files starts from 2005
@@ -188,23 +249,19 @@ class DataProcessor:
             # First sort by date to ensure proper forward fill
             final_df = final_df.sort_values('date')
             
-            # Forward fill missing values for each column except date
-            for column in final_df.columns:
-                if column != 'date':
-                    # Get current missing value count
-                    missing_before = final_df[column].isnull().sum()
-                    
-                    # Forward fill
-                    final_df[column] = final_df[column].ffill()
-                    
-                    # Get remaining missing value count
-                    missing_after = final_df[column].isnull().sum()
-                    
-                    # Log the changes
-                    if missing_before > 0:
-                        logger.info(f"Column {column}: Filled {missing_before - missing_after} missing values")
-                        if missing_after > 0:
-                            logger.warning(f"Column {column}: Still has {missing_after} missing values at the start of the series")
+            # Forward fill missing values for all columns except date in one pass,
+            # counting missing values per column from a single mask before and after
+            value_cols = final_df.columns.drop('date')
+            missing_before = final_df[value_cols].isna().to_numpy().sum(axis=0)
+            final_df[value_cols] = final_df[value_cols].ffill()
+            missing_after = final_df[value_cols].isna().to_numpy().sum(axis=0)
+            
+            # Log the changes
+            for column, before, after in zip(value_cols, missing_before, missing_after):
+                if before > 0:
+                    logger.info(f"Column {column}: Filled {before - after} missing values")
+                    if after > 0:
+                        logger.warning(f"Column {column}: Still has {after} missing values at the start of the series")
            
             # Reorder columns
             column_order = ['date', 'eur_usd', 'inventory', 'production', 'rigs',
@@ -217,7 +274,7 @@ class DataProcessor:
             # Save processed data with timestamp
             timestamp = datetime.now().strftime('%Y%m%d')
             output_file = self.output_dir / f'processed_data_{timestamp}.csv'
-            final_df.to_csv(output_file, index=False)
+            write_csv(final_df, output_file)
             logger.info(f"Successfully saved processed data to {output_file}")
             
             # Archive raw files after successful processing
@@ -229,11 +286,14 @@ class DataProcessor:
             logger.error(f"Error in processing pipeline: {str(e)}")
             raise
             
-if __name__ == "__main__":
+def main():
     try:
         processor = DataProcessor()
         processed_data = processor.process_data()
         logger.info("Data processing completed successfully")
     except Exception as e:
         logger.error(f"Pipeline failed: {str(e)}")
-        raise
\ No newline at end of file
+        raise
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
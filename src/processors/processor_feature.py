@@ -4,6 +4,8 @@ from pathlib import Path
 import logging
 from datetime import datetime
 
+from csv_io import CSV_ENGINE, write_csv
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -61,10 +63,9 @@ class FeatureProcessor:
         # if df.isnull().any().any():
         #     raise ValueError("Dataset contains missing values")
             
-        # Verify monthly frequency
-        dates = pd.to_datetime(df['date'])
-        date_diffs = dates.diff()[1:]  # Skip first row which will be NaT
-        if not all(diff.days >= 28 and diff.days <= 31 for diff in date_diffs):
+        # Verify monthly frequency (date is parsed as datetime when the file is read)
+        date_diffs = df['date'].diff()[1:]  # Skip first row which will be NaT
+        if not date_diffs.dt.days.between(28, 31).all():
             raise ValueError("Data does not have monthly frequency")
             
         logger.info("Data validation completed successfully")
@@ -80,19 +81,29 @@ class FeatureProcessor:
         logger.info(f"Dropped columns: {columns_to_drop}")
         return df
         
+    @staticmethod
+    def _rolling_mean(values, window):
+        """Trailing mean over `window` rows, NaN until the window is full."""
+        out = np.full(values.size, np.nan)
+        if values.size >= window:
+            out[window - 1:] = np.lib.stride_tricks.sliding_window_view(values, window).mean(axis=1)
+        return out
+
     def engineer_features(self, df):
         """Add engineered features"""
         logger.info("Engineering new features...")
         
-        # Convert date to datetime if not already
-        df['date'] = pd.to_datetime(df['date'])
+        # Work on one contiguous float64 copy of the target
+        wti = df['wti'].to_numpy(dtype=np.float64)
         
         # Add rolling means
-        df['wti_6m_rolling'] = df['wti'].rolling(window=6).mean()
-        df['wti_12m_rolling'] = df['wti'].rolling(window=12).mean()
+        df['wti_6m_rolling'] = self._rolling_mean(wti, 6)
+        df['wti_12m_rolling'] = self._rolling_mean(wti, 12)
         
         # Add price lag
-        df['wti_6m_lag'] = df['wti'].shift(6)
+        lag = np.full(wti.size, np.nan)
+        lag[6:] = wti[:-6]
+        df['wti_6m_lag'] = lag
         
         logger.info("Feature engineering completed")
         return df
@@ -101,15 +112,13 @@ class FeatureProcessor:
         """Handle NaN values from rolling calculations"""
         logger.info("Handling rolling window data...")
         
-        # Drop first 12 months of data to account for 12-month rolling mean
-        df = df.iloc[12:].copy()
+        # Drop first 12 months of data to account for 12-month rolling mean;
+        # reset_index already returns a new frame, so no explicit copy is needed
+        df = df.iloc[12:].reset_index(drop=True)
         
         # Verify no NaN values remain
         if df.isnull().any().any():
             raise ValueError("NaN values remain after dropping initial rows")
-            
-        # Reset index
-        df = df.reset_index(drop=True)
         
         logger.info("Rolling window handling completed")
         return df
@@ -118,13 +127,8 @@ class FeatureProcessor:
         """Reorder columns to place 'wti' as the last column (target variable)"""
         logger.info("Reordering columns to place target variable 'wti' at the end...")
         
-        # Get all columns except 'wti'
-        cols = [col for col in df.columns if col != 'wti']
-        # Add 'wti' at the end
-        cols.append('wti')
-        
-        # Reorder DataFrame columns
-        df = df[cols]
+        # Move 'wti' to the end: pop it and re-append it, no bulk copy
+        df['wti'] = df.pop('wti')
         
         logger.info("Column reordering completed")
         return df
@@ -138,9 +142,8 @@ class FeatureProcessor:
             raise ValueError("Final dataset contains missing values")
             
         # Check date continuity
-        dates = pd.to_datetime(df['date'])
-        date_diffs = dates.diff()[1:]
-        if not all(diff.days >= 28 and diff.days <= 31 for diff in date_diffs):
+        date_diffs = df['date'].diff()[1:]
+        if not date_diffs.dt.days.between(28, 31).all():
             raise ValueError("Dates are not continuous in final dataset")
             
         # Basic range checks for engineered features
@@ -161,7 +164,7 @@ class FeatureProcessor:
         # Save versioned file
         date_str = datetime.now().strftime("%Y%m%d")
         output_file = output_path / f"training_data_{date_str}.csv"
-        df.to_csv(output_file, index=False)
+        write_csv(df, output_file)
         
         logger.info(f"Data saved to {output_file}")
         return True
@@ -171,7 +174,7 @@ class FeatureProcessor:
         logger.info("Starting feature processing pipeline...")
         
         # Read input data
-        df = pd.read_csv(self.input_path)
+        df = pd.read_csv(self.input_path, engine=CSV_ENGINE, parse_dates=['date'])
         
         # Run pipeline steps
         self.validate_data(df)
@@ -185,6 +188,9 @@ class FeatureProcessor:
         logger.info("Feature processing pipeline completed successfully")
         return df
 
-if __name__ == "__main__":
+def main():
     processor = FeatureProcessor()
-    processed_data = processor.process()
\ No newline at end of file
+    processed_data = processor.process()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file